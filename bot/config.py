@@ -1,10 +1,53 @@
+import os
+import pickle
+
 import yaml
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 # Load chat modes
 # Define the configuration directory
 config_dir = Path(__file__).parent.parent.resolve() / "bot/resources"
-with open(config_dir / "chat_modes.yml", "r") as f:
-    chat_modes = yaml.safe_load(f)
+chat_modes_file = config_dir / "chat_modes.yml"
+# Parsed chat modes can be cached in an opt-in directory outside the source tree, keyed by the exact
+# mtime and size of the YAML file. The variable is read at import, before load_dotenv() runs in main(),
+# so it has to be set in the process environment.
+chat_modes_cache_dir = os.environ.get("CHAT_MODES_CACHE_DIR")
+chat_modes_cache = Path(chat_modes_cache_dir) / "chat_modes.pkl" if chat_modes_cache_dir else None
+
+
+def _load_chat_modes_cache(source_key):
+    try:
+        cached_key, cached_modes = pickle.loads(chat_modes_cache.read_bytes())
+    except Exception:
+        # missing, truncated or foreign cache file, fall back to the YAML file
+        return None
+    return cached_modes if cached_key == source_key else None
+
+
+def _write_chat_modes_cache(source_key, modes):
+    # write to a temp file first so a crash or a concurrent start never sees a partial cache
+    tmp_file = chat_modes_cache.with_name(f"{chat_modes_cache.name}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_bytes(pickle.dumps((source_key, modes), protocol=5))
+        os.replace(tmp_file, chat_modes_cache)
+    except OSError:
+        # cache directory may be missing or read-only, keep working from the YAML file
+        tmp_file.unlink(missing_ok=True)
+
 
+chat_modes = None
+if chat_modes_cache is not None:
+    _source_stat = chat_modes_file.stat()
+    _source_key = (_source_stat.st_mtime_ns, _source_stat.st_size)
+    chat_modes = _load_chat_modes_cache(_source_key)
+if chat_modes is None:
+    with open(chat_modes_file, "rb") as f:
+        chat_modes = yaml.load(f, Loader=_YamlLoader)
+    if chat_modes_cache is not None:
+        _write_chat_modes_cache(_source_key, chat_modes)
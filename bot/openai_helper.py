@@ -20,6 +20,10 @@ from utils import is_direct_result, encode_image, decode_image
 from plugin_manager import PluginManager
 
 # Models can be found here: https://platform.openai.com/docs/models/overview
+# Stable models that only gained function support after June 27, 2023
+STABLE_FUNCTION_MODELS = frozenset({"gpt-3.5-turbo", "gpt-4-turbo", "gpt-4o-2024-05-13"})
+# The cut-off date is long past, so the check only needs to run once at import
+STABLE_FUNCTIONS_RELEASED = datetime.date.today() > datetime.date(2023, 6, 27)
 
 
 FUNCTION_CALL_COUNTER = 0
@@ -39,8 +43,8 @@ def are_functions_available(model: str) -> bool:
     Whether the given model supports functions
     """
     # Stable models will be updated to support functions on June 27, 2023
-    if model in ("gpt-3.5-turbo", "gpt-4-turbo", "gpt-4o-2024-05-13"):
-        return datetime.date.today() > datetime.date(2023, 6, 27)
+    if model in STABLE_FUNCTION_MODELS:
+        return STABLE_FUNCTIONS_RELEASED
     return True
 
 
@@ -154,7 +158,7 @@ class OpenAIHelper:
         plugins_used = ()
         response = await self.__common_get_chat_response(chat_id, query, stream=True)
         if self.config['enable_functions'] and not self.conversations_vision[chat_id]:
-            logging.info(f"i am working and streaming")
+            logging.debug('Streaming response with functions enabled')
             response, plugins_used = await self.__handle_function_call(chat_id, response, stream=True)
             if is_direct_result(response):
                 yield response, '0'
@@ -169,7 +173,7 @@ class OpenAIHelper:
                 answer += delta.content
                 yield answer, 'not_finished'
         answer = answer.strip()
-        logging.info(f"this is the answer {answer}")
+        logging.debug('Streamed answer: %s', answer)
         self.__add_to_history(chat_id, role="assistant", content=answer)
         tokens_used = str(self.__count_tokens(self.conversations[chat_id]))
 
@@ -197,7 +201,7 @@ class OpenAIHelper:
         :param query: The query to send to the model
         :return: The answer from the model and the number of tokens used
         """
-        logging.info(f"__common_get_chat_response worked {FUNCTION_CALL_COUNTER} times")
+        logging.debug('__common_get_chat_response worked %s times', FUNCTION_CALL_COUNTER)
         bot_language = self.config['bot_language']
         try:
             if chat_id not in self.conversations or self.__max_age_reached(chat_id):
@@ -255,7 +259,7 @@ class OpenAIHelper:
     async def __handle_function_call(self, chat_id, response, stream=False, times=0, plugins_used=()):
         global FUNCTION_CALL_COUNTER
         FUNCTION_CALL_COUNTER += 1
-        logging.info(f"__handle_function_call worked {FUNCTION_CALL_COUNTER} times")
+        logging.debug('__handle_function_call worked %s times', FUNCTION_CALL_COUNTER)
         function_name = ''
         arguments = ''
         if stream:
@@ -270,10 +274,10 @@ class OpenAIHelper:
                     elif first_choice.finish_reason and first_choice.finish_reason == 'function_call':
                         break
                     else:
-                        logging.info(f" the resoponse is :{response}, the plug has been used {plugins_used}")
+                        logging.debug('No function call in response %s, plugins used: %s', response, plugins_used)
                         return response, plugins_used
                 else:
-                    logging.info(f"{response}", {plugins_used})
+                    logging.debug('No function call in response %s, plugins used: %s', response, plugins_used)
                     return response, plugins_used
         else:
             if len(response.choices) > 0:
@@ -284,10 +288,10 @@ class OpenAIHelper:
                     if first_choice.message.function_call.arguments:
                         arguments += first_choice.message.function_call.arguments
                 else:
-                    logging.info(f"{response}", {plugins_used})
+                    logging.debug('No function call in response %s, plugins used: %s', response, plugins_used)
                     return response, plugins_used
             else:
-                logging.info(f"{response}", {plugins_used})
+                logging.debug('No function call in response %s, plugins used: %s', response, plugins_used)
                 return response, plugins_used
 
         logging.info(f'Calling function {function_name} with arguments {arguments}')
@@ -1,20 +1,24 @@
+import importlib
 import json
 
-from plugins.gtts_text_to_speech import GTTSTextToSpeech
-from plugins.auto_tts import AutoTextToSpeech
-from plugins.dice import DicePlugin
-from plugins.youtube_audio_extractor import YouTubeAudioExtractorPlugin
-from plugins.ddg_image_search import DDGImageSearchPlugin
-from plugins.ddg_translate import DDGTranslatePlugin
-from plugins.spotify import SpotifyPlugin
-from plugins.crypto import CryptoPlugin
-from plugins.weather import WeatherPlugin
-from plugins.ddg_web_search import DDGWebSearchPlugin
-from plugins.wolfram_alpha import WolframAlphaPlugin
-from plugins.deepl import DeeplTranslatePlugin
-from plugins.worldtimeapi import WorldTimeApiPlugin
-from plugins.whois_ import WhoisPlugin
-from plugins.webshot import WebshotPlugin
+# Plugin modules are imported on demand, so only the enabled plugins (and their dependencies) are loaded
+PLUGIN_MAPPING = {
+    'wolfram': ('plugins.wolfram_alpha', 'WolframAlphaPlugin'),
+    'weather': ('plugins.weather', 'WeatherPlugin'),
+    'crypto': ('plugins.crypto', 'CryptoPlugin'),
+    'ddg_web_search': ('plugins.ddg_web_search', 'DDGWebSearchPlugin'),
+    'ddg_translate': ('plugins.ddg_translate', 'DDGTranslatePlugin'),
+    'ddg_image_search': ('plugins.ddg_image_search', 'DDGImageSearchPlugin'),
+    'spotify': ('plugins.spotify', 'SpotifyPlugin'),
+    'worldtimeapi': ('plugins.worldtimeapi', 'WorldTimeApiPlugin'),
+    'youtube_audio_extractor': ('plugins.youtube_audio_extractor', 'YouTubeAudioExtractorPlugin'),
+    'dice': ('plugins.dice', 'DicePlugin'),
+    'deepl_translate': ('plugins.deepl', 'DeeplTranslatePlugin'),
+    'gtts_text_to_speech': ('plugins.gtts_text_to_speech', 'GTTSTextToSpeech'),
+    'auto_tts': ('plugins.auto_tts', 'AutoTextToSpeech'),
+    'whois': ('plugins.whois_', 'WhoisPlugin'),
+    'webshot': ('plugins.webshot', 'WebshotPlugin'),
+}
 
 
 class PluginManager:
@@ -24,30 +28,25 @@ class PluginManager:
 
     def __init__(self, config):
         enabled_plugins = config.get('plugins', [])
-        plugin_mapping = {
-            'wolfram': WolframAlphaPlugin,
-            'weather': WeatherPlugin,
-            'crypto': CryptoPlugin,
-            'ddg_web_search': DDGWebSearchPlugin,
-            'ddg_translate': DDGTranslatePlugin,
-            'ddg_image_search': DDGImageSearchPlugin,
-            'spotify': SpotifyPlugin,
-            'worldtimeapi': WorldTimeApiPlugin,
-            'youtube_audio_extractor': YouTubeAudioExtractorPlugin,
-            'dice': DicePlugin,
-            'deepl_translate': DeeplTranslatePlugin,
-            'gtts_text_to_speech': GTTSTextToSpeech,
-            'auto_tts': AutoTextToSpeech,
-            'whois': WhoisPlugin,
-            'webshot': WebshotPlugin,
-        }
-        self.plugins = [plugin_mapping[plugin]() for plugin in enabled_plugins if plugin in plugin_mapping]
+        self.plugins = []
+        for plugin in enabled_plugins:
+            if plugin not in PLUGIN_MAPPING:
+                continue
+            module_name, class_name = PLUGIN_MAPPING[plugin]
+            plugin_class = getattr(importlib.import_module(module_name), class_name)
+            self.plugins.append(plugin_class())
+        # function names never change, so plugins are indexed by them once
+        self.plugins_by_function_name = {}
+        for plugin in self.plugins:
+            for spec in plugin.get_spec():
+                self.plugins_by_function_name.setdefault(spec.get('name'), plugin)
 
     def get_functions_specs(self):
         """
         Return the list of function specs that can be called by the model
         """
-        return [spec for specs in map(lambda plugin: plugin.get_spec(), self.plugins) for spec in specs]
+        # specs are re-read on every request since some embed the current date
+        return [spec for plugin in self.plugins for spec in plugin.get_spec()]
 
     async def call_function(self, function_name, helper, **kwargs):
         """
@@ -68,5 +67,4 @@ class PluginManager:
         return plugin.get_source_name()
 
     def __get_plugin_by_function_name(self, function_name):
-        return next((plugin for plugin in self.plugins
-                     if function_name in map(lambda spec: spec.get('name'), plugin.get_spec())), None)
+        return self.plugins_by_function_name.get(function_name)
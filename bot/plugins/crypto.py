@@ -11,26 +11,28 @@ class CryptoPlugin(Plugin):
     """
     A plugin to fetch the current rate of various cryptocurrencies
     """
+    SPEC = [{
+        "name": "get_crypto_rate",
+        "description": "Get the current rate of various crypto currencies",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "asset": {"type": "string", "description": "Asset of the crypto"}
+            },
+            "required": ["asset"],
+        },
+    }]
+
     def get_source_name(self) -> str:
         return "CoinCap"
 
     def get_spec(self) -> [Dict]:
-        return [{
-            "name": "get_crypto_rate",
-            "description": "Get the current rate of various crypto currencies",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "asset": {"type": "string", "description": "Asset of the crypto"}
-                },
-                "required": ["asset"],
-            },
-        }]
+        return self.SPEC
 
     async def execute(self, function_name, helper, **kwargs) -> Dict:
         if kwargs["asset"] == "btc" or kwargs["asset"] == "BTC":
             kwargs["asset"] = "bitcoin"
-        logging.info(f"crypto plugin works, the asset is: {kwargs}")
+        logging.debug('crypto plugin works, the asset is: %s', kwargs)
         response = requests.get(f"https://api.coincap.io/v2/assets/{kwargs['asset']}").json()
-        logging.info(f"the coin price {response}")
+        logging.debug('the coin price %s', response)
         return response
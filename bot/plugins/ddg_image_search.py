@@ -12,6 +12,36 @@ class DDGImageSearchPlugin(Plugin):
     """
     A plugin to search images and GIFs for a given query, using DuckDuckGo
     """
+    SPEC = [{
+        "name": "search_images",
+        "description": "Search image or GIFs for a given query",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "The query to search for"},
+                "type": {
+                    "type": "string",
+                    "enum": ["photo", "gif"],
+                    "description": "The type of image to search for. Default to `photo` if not specified",
+                },
+                "region": {
+                    "type": "string",
+                    "enum": ['xa-ar', 'xa-en', 'ar-es', 'au-en', 'at-de', 'be-fr', 'be-nl', 'br-pt', 'bg-bg',
+                             'ca-en', 'ca-fr', 'ct-ca', 'cl-es', 'cn-zh', 'co-es', 'hr-hr', 'cz-cs', 'dk-da',
+                             'ee-et', 'fi-fi', 'fr-fr', 'de-de', 'gr-el', 'hk-tzh', 'hu-hu', 'in-en', 'id-id',
+                             'id-en', 'ie-en', 'il-he', 'it-it', 'jp-jp', 'kr-kr', 'lv-lv', 'lt-lt', 'xl-es',
+                             'my-ms', 'my-en', 'mx-es', 'nl-nl', 'nz-en', 'no-no', 'pe-es', 'ph-en', 'ph-tl',
+                             'pl-pl', 'pt-pt', 'ro-ro', 'ru-ru', 'sg-en', 'sk-sk', 'sl-sl', 'za-en', 'es-es',
+                             'se-sv', 'ch-de', 'ch-fr', 'ch-it', 'tw-tzh', 'th-th', 'tr-tr', 'ua-uk', 'uk-en',
+                             'us-en', 'ue-es', 've-es', 'vn-vi', 'wt-wt'],
+                    "description": "The region to use for the search. Infer this from the language used for the"
+                                   "query. Default to `wt-wt` if not specified",
+                }
+            },
+            "required": ["query", "type", "region"],
+        },
+    }]
+
     def __init__(self):
         self.safesearch = os.getenv('DUCKDUCKGO_SAFESEARCH', 'moderate')
 
@@ -19,35 +49,7 @@ class DDGImageSearchPlugin(Plugin):
         return "DuckDuckGo Images"
 
     def get_spec(self) -> [Dict]:
-        return [{
-            "name": "search_images",
-            "description": "Search image or GIFs for a given query",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "The query to search for"},
-                    "type": {
-                        "type": "string",
-                        "enum": ["photo", "gif"],
-                        "description": "The type of image to search for. Default to `photo` if not specified",
-                    },
-                    "region": {
-                        "type": "string",
-                        "enum": ['xa-ar', 'xa-en', 'ar-es', 'au-en', 'at-de', 'be-fr', 'be-nl', 'br-pt', 'bg-bg',
-                                 'ca-en', 'ca-fr', 'ct-ca', 'cl-es', 'cn-zh', 'co-es', 'hr-hr', 'cz-cs', 'dk-da',
-                                 'ee-et', 'fi-fi', 'fr-fr', 'de-de', 'gr-el', 'hk-tzh', 'hu-hu', 'in-en', 'id-id',
-                                 'id-en', 'ie-en', 'il-he', 'it-it', 'jp-jp', 'kr-kr', 'lv-lv', 'lt-lt', 'xl-es',
-                                 'my-ms', 'my-en', 'mx-es', 'nl-nl', 'nz-en', 'no-no', 'pe-es', 'ph-en', 'ph-tl',
-                                 'pl-pl', 'pt-pt', 'ro-ro', 'ru-ru', 'sg-en', 'sk-sk', 'sl-sl', 'za-en', 'es-es',
-                                 'se-sv', 'ch-de', 'ch-fr', 'ch-it', 'tw-tzh', 'th-th', 'tr-tr', 'ua-uk', 'uk-en',
-                                 'us-en', 'ue-es', 've-es', 'vn-vi', 'wt-wt'],
-                        "description": "The region to use for the search. Infer this from the language used for the"
-                                       "query. Default to `wt-wt` if not specified",
-                    }
-                },
-                "required": ["query", "type", "region"],
-            },
-        }]
+        return self.SPEC
 
     async def execute(self, function_name, helper, **kwargs) -> Dict:
         with DDGS() as ddgs:
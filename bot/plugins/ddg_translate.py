@@ -9,22 +9,24 @@ class DDGTranslatePlugin(Plugin):
     """
     A plugin to translate a given text from a language to another, using DuckDuckGo
     """
+    SPEC = [{
+        "name": "translate",
+        "description": "Translate a given text from a language to another",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "The text to translate"},
+                "to_language": {"type": "string", "description": "The language to translate to (e.g. 'it')"}
+            },
+            "required": ["text", "to_language"],
+        },
+    }]
+
     def get_source_name(self) -> str:
         return "DuckDuckGo Translate"
 
     def get_spec(self) -> [Dict]:
-        return [{
-            "name": "translate",
-            "description": "Translate a given text from a language to another",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "The text to translate"},
-                    "to_language": {"type": "string", "description": "The language to translate to (e.g. 'it')"}
-                },
-                "required": ["text", "to_language"],
-            },
-        }]
+        return self.SPEC
 
     async def execute(self, function_name, helper, **kwargs) -> Dict:
         with DDGS() as ddgs:
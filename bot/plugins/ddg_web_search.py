@@ -11,6 +11,34 @@ class DDGWebSearchPlugin(Plugin):
     """
     A plugin to search the web for a given query, using DuckDuckGo
     """
+    SPEC = [{
+        "name": "web_search",
+        "description": "Execute a web search for the given query and return a list of results",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "the user query"
+                },
+                "region": {
+                    "type": "string",
+                    "enum": ['xa-ar', 'xa-en', 'ar-es', 'au-en', 'at-de', 'be-fr', 'be-nl', 'br-pt', 'bg-bg',
+                             'ca-en', 'ca-fr', 'ct-ca', 'cl-es', 'cn-zh', 'co-es', 'hr-hr', 'cz-cs', 'dk-da',
+                             'ee-et', 'fi-fi', 'fr-fr', 'de-de', 'gr-el', 'hk-tzh', 'hu-hu', 'in-en', 'id-id',
+                             'id-en', 'ie-en', 'il-he', 'it-it', 'jp-jp', 'kr-kr', 'lv-lv', 'lt-lt', 'xl-es',
+                             'my-ms', 'my-en', 'mx-es', 'nl-nl', 'nz-en', 'no-no', 'pe-es', 'ph-en', 'ph-tl',
+                             'pl-pl', 'pt-pt', 'ro-ro', 'ru-ru', 'sg-en', 'sk-sk', 'sl-sl', 'za-en', 'es-es',
+                             'se-sv', 'ch-de', 'ch-fr', 'ch-it', 'tw-tzh', 'th-th', 'tr-tr', 'ua-uk', 'uk-en',
+                             'us-en', 'ue-es', 've-es', 'vn-vi', 'wt-wt'],
+                    "description": "The region to use for the search. Infer this from the language used for the"
+                                   "query. Default to `wt-wt` if not specified",
+                }
+            },
+            "required": ["query", "region"],
+        },
+    }]
+
     def __init__(self):
         self.safesearch = os.getenv('DUCKDUCKGO_SAFESEARCH', 'moderate')
 
@@ -18,33 +46,7 @@ class DDGWebSearchPlugin(Plugin):
         return "DuckDuckGo"
 
     def get_spec(self) -> [Dict]:
-        return [{
-            "name": "web_search",
-            "description": "Execute a web search for the given query and return a list of results",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "the user query"
-                    },
-                    "region": {
-                        "type": "string",
-                        "enum": ['xa-ar', 'xa-en', 'ar-es', 'au-en', 'at-de', 'be-fr', 'be-nl', 'br-pt', 'bg-bg',
-                                 'ca-en', 'ca-fr', 'ct-ca', 'cl-es', 'cn-zh', 'co-es', 'hr-hr', 'cz-cs', 'dk-da',
-                                 'ee-et', 'fi-fi', 'fr-fr', 'de-de', 'gr-el', 'hk-tzh', 'hu-hu', 'in-en', 'id-id',
-                                 'id-en', 'ie-en', 'il-he', 'it-it', 'jp-jp', 'kr-kr', 'lv-lv', 'lt-lt', 'xl-es',
-                                 'my-ms', 'my-en', 'mx-es', 'nl-nl', 'nz-en', 'no-no', 'pe-es', 'ph-en', 'ph-tl',
-                                 'pl-pl', 'pt-pt', 'ro-ro', 'ru-ru', 'sg-en', 'sk-sk', 'sl-sl', 'za-en', 'es-es',
-                                 'se-sv', 'ch-de', 'ch-fr', 'ch-it', 'tw-tzh', 'th-th', 'tr-tr', 'ua-uk', 'uk-en',
-                                 'us-en', 'ue-es', 've-es', 'vn-vi', 'wt-wt'],
-                        "description": "The region to use for the search. Infer this from the language used for the"
-                                       "query. Default to `wt-wt` if not specified",
-                    }
-                },
-                "required": ["query", "region"],
-            },
-        }]
+        return self.SPEC
 
     async def execute(self, function_name, helper, **kwargs) -> Dict:
         with DDGS() as ddgs:
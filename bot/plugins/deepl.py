@@ -10,6 +10,19 @@ class DeeplTranslatePlugin(Plugin):
     """
     A plugin to translate a given text from a language to another, using DeepL
     """
+    SPEC = [{
+        "name": "translate",
+        "description": "Translate a given text from a language to another",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "The text to translate"},
+                "to_language": {"type": "string", "description": "The language to translate to (e.g. 'it')"}
+            },
+            "required": ["text", "to_language"],
+        },
+    }]
+
     def __init__(self):
         deepl_api_key = os.getenv('DEEPL_API_KEY')
         if not deepl_api_key:
@@ -20,18 +33,7 @@ class DeeplTranslatePlugin(Plugin):
         return "DeepL Translate"
 
     def get_spec(self) -> [Dict]:
-        return [{
-            "name": "translate",
-            "description": "Translate a given text from a language to another",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "The text to translate"},
-                    "to_language": {"type": "string", "description": "The language to translate to (e.g. 'it')"}
-                },
-                "required": ["text", "to_language"],
-            },
-        }]
+        return self.SPEC
 
     async def execute(self, function_name, helper, **kwargs) -> Dict:
         if self.api_key.endswith(':fx'):
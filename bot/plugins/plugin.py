@@ -19,6 +19,7 @@ class Plugin(ABC):
         """
         Function specs in the form of JSON schema as specified in the OpenAI documentation:
         https://platform.openai.com/docs/api-reference/chat/create#chat/create-functions
+        Called on every request, so plugins with static specs should return a prebuilt list.
         """
         pass
 
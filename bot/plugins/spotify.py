@@ -7,10 +7,91 @@ from spotipy import SpotifyOAuth
 from .plugin import Plugin
 
 
+_TIME_RANGE_PARAM = {
+    "type": "string",
+    "enum": ["short_term", "medium_term", "long_term"],
+    "description": "The time range of the data to be returned. Short term is the last 4 weeks, "
+                   "medium term is last 6 months, long term is last several years. Default to "
+                   "short_term if not specified."
+}
+_LIMIT_PARAM = {
+    "type": "integer",
+    "description": "The number of results to return. Max is 50. Default to 5 if not specified.",
+}
+_TYPE_PARAM = {
+    "type": "string",
+    "enum": ["album", "artist", "track"],
+    "description": "Type of content to search",
+}
+
+
 class SpotifyPlugin(Plugin):
     """
     A plugin to fetch information from Spotify
     """
+    SPEC = [
+        {
+            "name": "spotify_get_currently_playing_song",
+            "description": "Get the user's currently playing song",
+            "parameters": {
+                "type": "object",
+                "properties": {}
+            }
+        },
+        {
+            "name": "spotify_get_users_top_artists",
+            "description": "Get the user's top listened artists",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "time_range": _TIME_RANGE_PARAM,
+                    "limit": _LIMIT_PARAM
+                }
+            }
+        },
+        {
+            "name": "spotify_get_users_top_tracks",
+            "description": "Get the user's top listened tracks",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "time_range": _TIME_RANGE_PARAM,
+                    "limit": _LIMIT_PARAM
+                }
+            }
+        },
+        {
+            "name": "spotify_search_by_query",
+            "description": "Search spotify content by query",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "The search query",
+                    },
+                    "type": _TYPE_PARAM
+                },
+                "required": ["query", "type"]
+            }
+        },
+        {
+            "name": "spotify_lookup_by_id",
+            "description": "Lookup spotify content by id",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "id": {
+                        "type": "string",
+                        "description": "The exact id to lookup. Can be a track id, an artist id or an album id",
+                    },
+                    "type": _TYPE_PARAM
+                },
+                "required": ["id", "type"]
+            }
+        }
+    ]
+
     def __init__(self):
         spotify_client_id = os.getenv('SPOTIFY_CLIENT_ID')
         spotify_client_secret = os.getenv('SPOTIFY_CLIENT_SECRET')
@@ -32,84 +113,7 @@ class SpotifyPlugin(Plugin):
         return "Spotify"
 
     def get_spec(self) -> [Dict]:
-        time_range_param = {
-            "type": "string",
-            "enum": ["short_term", "medium_term", "long_term"],
-            "description": "The time range of the data to be returned. Short term is the last 4 weeks, "
-                           "medium term is last 6 months, long term is last several years. Default to "
-                           "short_term if not specified."
-        }
-        limit_param = {
-            "type": "integer",
-            "description": "The number of results to return. Max is 50. Default to 5 if not specified.",
-        }
-        type_param = {
-            "type": "string",
-            "enum": ["album", "artist", "track"],
-            "description": "Type of content to search",
-        }
-        return [
-            {
-                "name": "spotify_get_currently_playing_song",
-                "description": "Get the user's currently playing song",
-                "parameters": {
-                    "type": "object",
-                    "properties": {}
-                }
-            },
-            {
-                "name": "spotify_get_users_top_artists",
-                "description": "Get the user's top listened artists",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "time_range": time_range_param,
-                        "limit": limit_param
-                    }
-                }
-            },
-            {
-                "name": "spotify_get_users_top_tracks",
-                "description": "Get the user's top listened tracks",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "time_range": time_range_param,
-                        "limit": limit_param
-                    }
-                }
-            },
-            {
-                "name": "spotify_search_by_query",
-                "description": "Search spotify content by query",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "The search query",
-                        },
-                        "type": type_param
-                    },
-                    "required": ["query", "type"]
-                }
-            },
-            {
-                "name": "spotify_lookup_by_id",
-                "description": "Lookup spotify content by id",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "id": {
-                            "type": "string",
-                            "description": "The exact id to lookup. Can be a track id, an artist id or an album id",
-                        },
-                        "type": type_param
-                    },
-                    "required": ["id", "type"]
-                }
-            }
-        ]
+        return self.SPEC
 
     async def execute(self, function_name, helper, **kwargs) -> Dict:
         time_range = kwargs.get('time_range', 'short_term')
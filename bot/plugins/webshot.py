@@ -6,21 +6,23 @@ class WebshotPlugin(Plugin):
     """
     A plugin to screenshot a website
     """
+    SPEC = [{
+        "name": "screenshot_website",
+        "description": "Show screenshot/image of a website from a given url or domain name.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "url": {"type": "string", "description": "Website url or domain name. Correctly formatted url is required. Example: https://www.google.com"}
+            },
+            "required": ["url"],
+        },
+    }]
+
     def get_source_name(self) -> str:
         return "WebShot"
 
     def get_spec(self) -> [Dict]:
-        return [{
-            "name": "screenshot_website",
-            "description": "Show screenshot/image of a website from a given url or domain name.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "url": {"type": "string", "description": "Website url or domain name. Correctly formatted url is required. Example: https://www.google.com"}
-                },
-                "required": ["url"],
-            },
-        }]
+        return self.SPEC
     
     def generate_random_string(self, length):
         characters = string.ascii_letters + string.digits
@@ -8,21 +8,23 @@ class WhoisPlugin(Plugin):
     """
     A plugin to query whois database
     """
+    SPEC = [{
+        "name": "get_whois",
+        "description": "Get whois registration and expiry information for a domain",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "domain": {"type": "string", "description": "Domain name"}
+            },
+            "required": ["domain"],
+        },
+    }]
+
     def get_source_name(self) -> str:
         return "Whois"
 
     def get_spec(self) -> [Dict]:
-        return [{
-            "name": "get_whois",
-            "description": "Get whois registration and expiry information for a domain",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "domain": {"type": "string", "description": "Domain name"}
-                },
-                "required": ["domain"],
-            },
-        }]
+        return self.SPEC
 
     async def execute(self, function_name, helper, **kwargs) -> Dict:
         try:
@@ -10,6 +10,18 @@ class WolframAlphaPlugin(Plugin):
     """
     A plugin to answer questions using WolframAlpha.
     """
+    SPEC = [{
+        "name": "answer_with_wolfram_alpha",
+        "description": "Get an answer to a question using Wolfram Alpha. Input should the the query in English.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "The search query, in english (translate if necessary)"}
+            },
+            "required": ["query"]
+        }
+    }]
+
     def __init__(self):
         wolfram_app_id = os.getenv('WOLFRAM_APP_ID')
         if not wolfram_app_id:
@@ -20,17 +32,7 @@ class WolframAlphaPlugin(Plugin):
         return "WolframAlpha"
 
     def get_spec(self) -> [Dict]:
-        return [{
-            "name": "answer_with_wolfram_alpha",
-            "description": "Get an answer to a question using Wolfram Alpha. Input should the the query in English.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "The search query, in english (translate if necessary)"}
-                },
-                "required": ["query"]
-            }
-        }]
+        return self.SPEC
 
     async def execute(self, function_name, helper, **kwargs) -> Dict:
         client = wolframalpha.Client(self.app_id)
@@ -12,21 +12,23 @@ class YouTubeAudioExtractorPlugin(Plugin):
     A plugin to extract audio from a YouTube video
     """
 
+    SPEC = [{
+        "name": "extract_youtube_audio",
+        "description": "Extract audio from a YouTube video",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "youtube_link": {"type": "string", "description": "YouTube video link to extract audio from"}
+            },
+            "required": ["youtube_link"],
+        },
+    }]
+
     def get_source_name(self) -> str:
         return "YouTube Audio Extractor"
 
     def get_spec(self) -> [Dict]:
-        return [{
-            "name": "extract_youtube_audio",
-            "description": "Extract audio from a YouTube video",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "youtube_link": {"type": "string", "description": "YouTube video link to extract audio from"}
-                },
-                "required": ["youtube_link"],
-            },
-        }]
+        return self.SPEC
 
     async def execute(self, function_name, helper, **kwargs) -> Dict:
         link = kwargs['youtube_link']
@@ -18,11 +18,21 @@ from PIL import Image
 from utils import is_group_chat, get_thread_id, message_text, wrap_with_indicator, split_into_chunks, \
     edit_message_with_retry, get_stream_cutoff_values, is_allowed, get_remaining_budget, is_admin, is_within_budget, \
     get_reply_to_message_id, add_chat_request_to_usage_tracker, error_handler, is_direct_result, handle_direct_result, \
-    cleanup_intermediate_files, get_paginated_keyboard
+    cleanup_intermediate_files, get_paginated_keyboard, user_id_set
 from openai_helper import OpenAIHelper, localized_text
 from usage_tracker import UsageTracker
 from config import chat_modes
 
+# Composite message filters, built once for all handler registrations
+GROUP_CHAT_FILTER = filters.ChatType.GROUP | filters.ChatType.SUPERGROUP
+IMAGE_FILTER = filters.PHOTO | filters.Document.IMAGE
+TRANSCRIBE_FILTER = filters.AUDIO | filters.VOICE | filters.Document.AUDIO | \
+                    filters.VIDEO | filters.VIDEO_NOTE | filters.Document.VIDEO
+TEXT_FILTER = filters.TEXT & (~filters.COMMAND)
+
+# Seconds between writes of pending usage changes to the usage logs
+USAGE_FLUSH_INTERVAL = 5
+
 
 class ChatGPTTelegramBot:
     """
@@ -58,6 +68,7 @@ class ChatGPTTelegramBot:
         self.disallowed_message = localized_text('disallowed', bot_language)
         self.budget_limit_message = localized_text('budget_limit', bot_language)
         self.usage = {}
+        self.usage_flush_task = None
         self.last_message = {}
         self.inline_queries_cache = {}
 
@@ -212,7 +223,7 @@ class ChatGPTTelegramBot:
 
         # Extracting page index from callback data
         page_index = int(query.data.split("|")[1])
-        logging.info(f"page index is {page_index}")
+        logging.debug('page index is %s', page_index)
         if page_index < 0:
             return
 
@@ -228,12 +239,12 @@ class ChatGPTTelegramBot:
                             f'is not allowed to reset the conversation')
             await self.send_disallowed_message(update, context)
             return
-        logging.info(f"update is NoNe: {update}")
+        logging.debug('set chat mode update: %s', update)
         query = update.callback_query
         await query.answer()
 
         chat_mode = query.data.split("|")[1]
-        logging.info(f"chat mode is : {chat_mode}")
+        logging.debug('chat mode is: %s', chat_mode)
         core_chat_mode = chat_modes
         # await update.message.reply_text(
         #     f"{core_chat_mode[chat_mode]['welcome_message']}",
@@ -333,7 +344,7 @@ class ChatGPTTelegramBot:
                 user_id = update.message.from_user.id
                 self.usage[user_id].add_image_request(image_size, self.config['image_prices'])
                 # add guest chat request to guest usage tracker
-                if str(user_id) not in self.config['allowed_user_ids'].split(',') and 'guests' in self.usage:
+                if str(user_id) not in user_id_set(self.config['allowed_user_ids']) and 'guests' in self.usage:
                     self.usage["guests"].add_image_request(image_size, self.config['image_prices'])
 
             except Exception as e:
@@ -379,7 +390,7 @@ class ChatGPTTelegramBot:
                 user_id = update.message.from_user.id
                 self.usage[user_id].add_tts_request(text_length, self.config['tts_model'], self.config['tts_prices'])
                 # add guest chat request to guest usage tracker
-                if str(user_id) not in self.config['allowed_user_ids'].split(',') and 'guests' in self.usage:
+                if str(user_id) not in user_id_set(self.config['allowed_user_ids']) and 'guests' in self.usage:
                     self.usage["guests"].add_tts_request(text_length, self.config['tts_model'],
                                                          self.config['tts_prices'])
 
@@ -454,7 +465,7 @@ class ChatGPTTelegramBot:
                 transcription_price = self.config['transcription_price']
                 self.usage[user_id].add_transcription_seconds(audio_track.duration_seconds, transcription_price)
 
-                allowed_user_ids = self.config['allowed_user_ids'].split(',')
+                allowed_user_ids = user_id_set(self.config['allowed_user_ids'])
                 if str(user_id) not in allowed_user_ids and 'guests' in self.usage:
                     self.usage["guests"].add_transcription_seconds(audio_track.duration_seconds, transcription_price)
 
@@ -698,7 +709,7 @@ class ChatGPTTelegramBot:
             vision_token_price = self.config['vision_token_price']
             self.usage[user_id].add_vision_tokens(total_tokens, vision_token_price)
 
-            allowed_user_ids = self.config['allowed_user_ids'].split(',')
+            allowed_user_ids = user_id_set(self.config['allowed_user_ids'])
             if str(user_id) not in allowed_user_ids and 'guests' in self.usage:
                 self.usage["guests"].add_vision_tokens(total_tokens, vision_token_price)
 
@@ -1106,6 +1117,36 @@ class ChatGPTTelegramBot:
         """
         await application.bot.set_my_commands(self.group_commands, scope=BotCommandScopeAllGroupChats())
         await application.bot.set_my_commands(self.commands)
+        self.usage_flush_task = asyncio.create_task(self.flush_usage_periodically())
+
+    async def post_shutdown(self, application: Application) -> None:
+        """
+        Post shutdown hook for the bot.
+        """
+        if self.usage_flush_task is not None:
+            self.usage_flush_task.cancel()
+        self.flush_usage()
+
+    def flush_usage(self):
+        """
+        Writes the usage of all users with pending changes to their usage files.
+        """
+        for tracker in list(self.usage.values()):
+            if not tracker.dirty:
+                continue
+            try:
+                tracker.save()
+            except Exception as e:
+                logging.warning(f'Failed to write usage of user {tracker.user_id} to usage_logs: {str(e)}')
+
+    async def flush_usage_periodically(self):
+        """
+        Batches usage writes, flushing pending changes every USAGE_FLUSH_INTERVAL seconds
+        instead of rewriting a user's file on every request.
+        """
+        while True:
+            await asyncio.sleep(USAGE_FLUSH_INTERVAL)
+            self.flush_usage()
 
     def run(self):
         """
@@ -1116,34 +1157,32 @@ class ChatGPTTelegramBot:
             .proxy_url(self.config['proxy']) \
             .get_updates_proxy_url(self.config['proxy']) \
             .post_init(self.post_init) \
+            .post_shutdown(self.post_shutdown) \
             .concurrent_updates(True) \
             .build()
 
-        application.add_handler(CommandHandler('reset', self.reset))
-        application.add_handler(CommandHandler('help', self.help))
-        application.add_handler(CommandHandler('image', self.image))
-        application.add_handler(CommandHandler('tts', self.tts))
-        application.add_handler(CommandHandler('start', self.help))
-        application.add_handler(CommandHandler('stats', self.stats))
-        application.add_handler(CommandHandler('resend', self.resend))
-        application.add_handler(CommandHandler('brains', self.get_chat_modes))
-        application.add_handler(CommandHandler(
-            'chat', self.prompt, filters=filters.ChatType.GROUP | filters.ChatType.SUPERGROUP)
-        )
-        application.add_handler(MessageHandler(
-            filters.PHOTO | filters.Document.IMAGE,
-            self.vision))
-        application.add_handler(MessageHandler(
-            filters.AUDIO | filters.VOICE | filters.Document.AUDIO |
-            filters.VIDEO | filters.VIDEO_NOTE | filters.Document.VIDEO,
-            self.transcribe))
-        application.add_handler(MessageHandler(filters.TEXT & (~filters.COMMAND), self.prompt))
-        application.add_handler(InlineQueryHandler(self.inline_query, chat_types=[
-            constants.ChatType.GROUP, constants.ChatType.SUPERGROUP, constants.ChatType.PRIVATE
-        ]))
-        application.add_handler(CallbackQueryHandler(self.get_chat_modes_callback, pattern="^show_chat_modes"))
-        application.add_handler(CallbackQueryHandler(self.set_chat_mode_handle, pattern="^set_chat_mode"))
-        application.add_handler(CallbackQueryHandler(self.handle_callback_inline_query))
+        commands = [
+            ('reset', self.reset),
+            ('help', self.help),
+            ('image', self.image),
+            ('tts', self.tts),
+            ('start', self.help),
+            ('stats', self.stats),
+            ('resend', self.resend),
+            ('brains', self.get_chat_modes),
+        ]
+        application.add_handlers([CommandHandler(command, callback) for command, callback in commands] + [
+            CommandHandler('chat', self.prompt, filters=GROUP_CHAT_FILTER),
+            MessageHandler(IMAGE_FILTER, self.vision),
+            MessageHandler(TRANSCRIBE_FILTER, self.transcribe),
+            MessageHandler(TEXT_FILTER, self.prompt),
+            InlineQueryHandler(self.inline_query, chat_types=[
+                constants.ChatType.GROUP, constants.ChatType.SUPERGROUP, constants.ChatType.PRIVATE
+            ]),
+            CallbackQueryHandler(self.get_chat_modes_callback, pattern="^show_chat_modes"),
+            CallbackQueryHandler(self.set_chat_mode_handle, pattern="^set_chat_mode"),
+            CallbackQueryHandler(self.handle_callback_inline_query),
+        ])
         application.add_error_handler(error_handler)
 
         application.run_polling()
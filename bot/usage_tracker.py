@@ -1,19 +1,37 @@
-import os.path
+import os
 import pathlib
 import json
 from datetime import date
 
+# position of each image size and tts model in the image_prices and tts_prices lists
+IMAGE_SIZE_INDEX = {"256x256": 0, "512x512": 1, "1024x1024": 2}
+TTS_MODEL_INDEX = {"tts-1": 0, "tts-1-hd": 1}
+
 
 def year_month(date_str):
     # extract string of year-month from date, eg: '2023-03'
     return str(date_str)[:7]
 
 
+def month_values(usage_by_day, month):
+    """Yields the values logged for the given year-month.
+    Each possible day of the month is looked up by key, so the cost is bounded
+    by the month's length and does not depend on the order days were stored in.
+    :param usage_by_day: dict of usage values keyed by ISO date string
+    :param month: year-month as string, eg: '2023-03'
+    """
+    for day in range(1, 32):
+        value = usage_by_day.get(f"{month}-{day:02d}")
+        if value is not None:
+            yield value
+
+
 class UsageTracker:
     """
     UsageTracker class
     Enables tracking of daily/monthly usage per user.
     User files are stored as JSON in /usage_logs directory.
+    Changes are kept in memory until save() is called, the bot flushes them periodically.
     JSON example:
     {
         "user_name": "@user_name",
@@ -40,6 +58,9 @@ class UsageTracker:
     }
     """
 
+    # one tracker is kept in memory per user, so avoid a __dict__ per instance
+    __slots__ = ("user_id", "logs_dir", "user_file", "usage", "dirty")
+
     def __init__(self, user_id, user_name, logs_dir="usage_logs"):
         """
         Initializes UsageTracker for a user with current date.
@@ -52,15 +73,14 @@ class UsageTracker:
         self.logs_dir = logs_dir
         # path to usage file of given user
         self.user_file = f"{logs_dir}/{user_id}.json"
+        # usage changes are kept in memory and written to the user file by save()
+        self.dirty = False
 
-        if os.path.isfile(self.user_file):
+        try:
+            # open the file directly instead of checking for it first, one stat less per load
             with open(self.user_file, "r") as file:
                 self.usage = json.load(file)
-            if 'vision_tokens' not in self.usage['usage_history']:
-                self.usage['usage_history']['vision_tokens'] = {}
-            if 'tts_characters' not in self.usage['usage_history']:
-                self.usage['usage_history']['tts_characters'] = {}
-        else:
+        except FileNotFoundError:
             # ensure directory exists
             pathlib.Path(logs_dir).mkdir(exist_ok=True)
             # create new dictionary for this user
@@ -69,6 +89,23 @@ class UsageTracker:
                 "current_cost": {"day": 0.0, "month": 0.0, "all_time": 0.0, "last_update": str(date.today())},
                 "usage_history": {"chat_tokens": {}, "transcription_seconds": {}, "number_images": {}, "tts_characters": {}, "vision_tokens":{}}
             }
+        else:
+            if 'vision_tokens' not in self.usage['usage_history']:
+                self.usage['usage_history']['vision_tokens'] = {}
+            if 'tts_characters' not in self.usage['usage_history']:
+                self.usage['usage_history']['tts_characters'] = {}
+
+    def save(self):
+        """Writes the usage of this user to their usage file.
+        The data is written to a temporary file first and then moved over the old file,
+        so costs and usage history are always replaced together and a crash mid-write
+        can't leave a truncated file behind.
+        """
+        tmp_file = f"{self.user_file}.tmp"
+        with open(tmp_file, "w") as outfile:
+            json.dump(self.usage, outfile)
+        os.replace(tmp_file, self.user_file)
+        self.dirty = False
 
     # token usage functions:
 
@@ -77,82 +114,77 @@ class UsageTracker:
         :param tokens: total tokens used in last request
         :param tokens_price: price per 1000 tokens, defaults to 0.002
         """
-        today = date.today()
+        today = date.today().isoformat()
         token_cost = round(float(tokens) * tokens_price / 1000, 6)
         self.add_current_costs(token_cost)
 
         # update usage_history
-        if str(today) in self.usage["usage_history"]["chat_tokens"]:
+        if today in self.usage["usage_history"]["chat_tokens"]:
             # add token usage to existing date
-            self.usage["usage_history"]["chat_tokens"][str(today)] += tokens
+            self.usage["usage_history"]["chat_tokens"][today] += tokens
         else:
             # create new entry for current date
-            self.usage["usage_history"]["chat_tokens"][str(today)] = tokens
+            self.usage["usage_history"]["chat_tokens"][today] = tokens
 
-        # write updated token usage to user file
-        with open(self.user_file, "w") as outfile:
-            json.dump(self.usage, outfile)
+        # mark updated token usage to be written to user file
+        self.dirty = True
 
     def get_current_token_usage(self):
         """Get token amounts used for today and this month
 
         :return: total number of tokens used per day and per month
         """
-        today = date.today()
-        if str(today) in self.usage["usage_history"]["chat_tokens"]:
-            usage_day = self.usage["usage_history"]["chat_tokens"][str(today)]
+        today = date.today().isoformat()
+        if today in self.usage["usage_history"]["chat_tokens"]:
+            usage_day = self.usage["usage_history"]["chat_tokens"][today]
         else:
             usage_day = 0
-        month = str(today)[:7]  # year-month as string
+        month = today[:7]  # year-month as string
         usage_month = 0
-        for today, tokens in self.usage["usage_history"]["chat_tokens"].items():
-            if today.startswith(month):
-                usage_month += tokens
+        for tokens in month_values(self.usage["usage_history"]["chat_tokens"], month):
+            usage_month += tokens
         return usage_day, usage_month
 
     # image usage functions:
 
-    def add_image_request(self, image_size, image_prices="0.016,0.018,0.02"):
+    def add_image_request(self, image_size, image_prices=(0.016, 0.018, 0.02)):
         """Add image request to users usage history and update current costs.
 
         :param image_size: requested image size
         :param image_prices: prices for images of sizes ["256x256", "512x512", "1024x1024"],
-                             defaults to [0.016, 0.018, 0.02]
+                             defaults to (0.016, 0.018, 0.02)
         """
-        sizes = ["256x256", "512x512", "1024x1024"]
-        requested_size = sizes.index(image_size)
+        requested_size = IMAGE_SIZE_INDEX[image_size]
         image_cost = image_prices[requested_size]
-        today = date.today()
+        today = date.today().isoformat()
         self.add_current_costs(image_cost)
 
         # update usage_history
-        if str(today) in self.usage["usage_history"]["number_images"]:
+        if today in self.usage["usage_history"]["number_images"]:
             # add token usage to existing date
-            self.usage["usage_history"]["number_images"][str(today)][requested_size] += 1
+            self.usage["usage_history"]["number_images"][today][requested_size] += 1
         else:
             # create new entry for current date
-            self.usage["usage_history"]["number_images"][str(today)] = [0, 0, 0]
-            self.usage["usage_history"]["number_images"][str(today)][requested_size] += 1
+            self.usage["usage_history"]["number_images"][today] = [0, 0, 0]
+            self.usage["usage_history"]["number_images"][today][requested_size] += 1
 
-        # write updated image number to user file
-        with open(self.user_file, "w") as outfile:
-            json.dump(self.usage, outfile)
+        # mark updated image number to be written to user file
+        self.dirty = True
 
     def get_current_image_count(self):
         """Get number of images requested for today and this month.
 
         :return: total number of images requested per day and per month
         """
-        today = date.today()
-        if str(today) in self.usage["usage_history"]["number_images"]:
-            usage_day = sum(self.usage["usage_history"]["number_images"][str(today)])
+        today = date.today().isoformat()
+        if today in self.usage["usage_history"]["number_images"]:
+            usage_day = sum(self.usage["usage_history"]["number_images"][today])
         else:
             usage_day = 0
-        month = str(today)[:7]  # year-month as string
+        month = today[:7]  # year-month as string
         usage_month = 0
-        for today, images in self.usage["usage_history"]["number_images"].items():
-            if today.startswith(month):
-                usage_month += sum(images)
+        for images in month_values(self.usage["usage_history"]["number_images"], month):
+            usage_month += sum(images)
         return usage_day, usage_month
 
 
@@ -163,45 +195,42 @@ class UsageTracker:
         :param tokens: total tokens used in last request
         :param vision_token_price: price per 1K tokens transcription, defaults to 0.01
         """
-        today = date.today()
+        today = date.today().isoformat()
         token_price = round(tokens * vision_token_price / 1000, 2)
         self.add_current_costs(token_price)
 
         # update usage_history
-        if str(today) in self.usage["usage_history"]["vision_tokens"]:
+        if today in self.usage["usage_history"]["vision_tokens"]:
             # add requested seconds to existing date
-            self.usage["usage_history"]["vision_tokens"][str(today)] += tokens
+            self.usage["usage_history"]["vision_tokens"][today] += tokens
         else:
             # create new entry for current date
-            self.usage["usage_history"]["vision_tokens"][str(today)] = tokens
+            self.usage["usage_history"]["vision_tokens"][today] = tokens
 
-        # write updated token usage to user file
-        with open(self.user_file, "w") as outfile:
-            json.dump(self.usage, outfile)
+        # mark updated token usage to be written to user file
+        self.dirty = True
 
     def get_current_vision_tokens(self):
         """Get vision tokens for today and this month.
 
         :return: total amount of vision tokens per day and per month
         """
-        today = date.today()
-        if str(today) in self.usage["usage_history"]["vision_tokens"]:
-            tokens_day = self.usage["usage_history"]["vision_tokens"][str(today)]
+        today = date.today().isoformat()
+        if today in self.usage["usage_history"]["vision_tokens"]:
+            tokens_day = self.usage["usage_history"]["vision_tokens"][today]
         else:
             tokens_day = 0
-        month = str(today)[:7]  # year-month as string
+        month = today[:7]  # year-month as string
         tokens_month = 0
-        for today, tokens in self.usage["usage_history"]["vision_tokens"].items():
-            if today.startswith(month):
-                tokens_month += tokens
+        for tokens in month_values(self.usage["usage_history"]["vision_tokens"], month):
+            tokens_month += tokens
         return tokens_day, tokens_month
 
     # tts usage functions:
 
     def add_tts_request(self, text_length, tts_model, tts_prices):
-        tts_models = ['tts-1', 'tts-1-hd']
-        price = tts_prices[tts_models.index(tts_model)]
-        today = date.today()
+        price = tts_prices[TTS_MODEL_INDEX[tts_model]]
+        today = date.today().isoformat()
         tts_price = round(text_length * price / 1000, 2)
         self.add_current_costs(tts_price)
 
@@ -212,16 +241,15 @@ class UsageTracker:
             self.usage['usage_history']['tts_characters'][tts_model] = {}
 
         # update usage_history
-        if str(today) in self.usage["usage_history"]["tts_characters"][tts_model]:
+        if today in self.usage["usage_history"]["tts_characters"][tts_model]:
             # add requested text length to existing date
-            self.usage["usage_history"]["tts_characters"][tts_model][str(today)] += text_length
+            self.usage["usage_history"]["tts_characters"][tts_model][today] += text_length
         else:
             # create new entry for current date
-            self.usage["usage_history"]["tts_characters"][tts_model][str(today)] = text_length
+            self.usage["usage_history"]["tts_characters"][tts_model][today] = text_length
 
-        # write updated token usage to user file
-        with open(self.user_file, "w") as outfile:
-            json.dump(self.usage, outfile)
+        # mark updated token usage to be written to user file
+        self.dirty = True
 
     def get_current_tts_usage(self):
         """Get length of speech generated for today and this month.
@@ -229,21 +257,19 @@ class UsageTracker:
         :return: total amount of characters converted to speech per day and per month
         """
 
-        tts_models = ['tts-1', 'tts-1-hd']
-        today = date.today()
+        today = date.today().isoformat()
         characters_day = 0
-        for tts_model in tts_models:
+        for tts_model in TTS_MODEL_INDEX:
             if tts_model in self.usage["usage_history"]["tts_characters"] and \
-                str(today) in self.usage["usage_history"]["tts_characters"][tts_model]:
-                characters_day += self.usage["usage_history"]["tts_characters"][tts_model][str(today)]
+                today in self.usage["usage_history"]["tts_characters"][tts_model]:
+                characters_day += self.usage["usage_history"]["tts_characters"][tts_model][today]
 
-        month = str(today)[:7]  # year-month as string
+        month = today[:7]  # year-month as string
         characters_month = 0
-        for tts_model in tts_models:
+        for tts_model in TTS_MODEL_INDEX:
             if tts_model in self.usage["usage_history"]["tts_characters"]: 
-                for today, characters in self.usage["usage_history"]["tts_characters"][tts_model].items():
-                    if today.startswith(month):
-                        characters_month += characters
+                for characters in month_values(self.usage["usage_history"]["tts_characters"][tts_model], month):
+                    characters_month += characters
         return int(characters_day), int(characters_month)
 
 
@@ -254,21 +280,20 @@ class UsageTracker:
         :param seconds: total seconds used in last request
         :param minute_price: price per minute transcription, defaults to 0.006
         """
-        today = date.today()
+        today = date.today().isoformat()
         transcription_price = round(seconds * minute_price / 60, 2)
         self.add_current_costs(transcription_price)
 
         # update usage_history
-        if str(today) in self.usage["usage_history"]["transcription_seconds"]:
+        if today in self.usage["usage_history"]["transcription_seconds"]:
             # add requested seconds to existing date
-            self.usage["usage_history"]["transcription_seconds"][str(today)] += seconds
+            self.usage["usage_history"]["transcription_seconds"][today] += seconds
         else:
             # create new entry for current date
-            self.usage["usage_history"]["transcription_seconds"][str(today)] = seconds
+            self.usage["usage_history"]["transcription_seconds"][today] = seconds
 
-        # write updated token usage to user file
-        with open(self.user_file, "w") as outfile:
-            json.dump(self.usage, outfile)
+        # mark updated token usage to be written to user file
+        self.dirty = True
 
     def add_current_costs(self, request_cost):
         """
@@ -278,8 +303,9 @@ class UsageTracker:
         last_update = date.fromisoformat(self.usage["current_cost"]["last_update"])
 
         # add to all_time cost, initialize with calculation of total_cost if key doesn't exist
-        self.usage["current_cost"]["all_time"] = \
-            self.usage["current_cost"].get("all_time", self.initialize_all_time_cost()) + request_cost
+        if "all_time" not in self.usage["current_cost"]:
+            self.usage["current_cost"]["all_time"] = self.initialize_all_time_cost()
+        self.usage["current_cost"]["all_time"] += request_cost
         # add current cost, update new day
         if today == last_update:
             self.usage["current_cost"]["day"] += request_cost
@@ -297,16 +323,15 @@ class UsageTracker:
 
         :return: total amount of time transcribed per day and per month (4 values)
         """
-        today = date.today()
-        if str(today) in self.usage["usage_history"]["transcription_seconds"]:
-            seconds_day = self.usage["usage_history"]["transcription_seconds"][str(today)]
+        today = date.today().isoformat()
+        if today in self.usage["usage_history"]["transcription_seconds"]:
+            seconds_day = self.usage["usage_history"]["transcription_seconds"][today]
         else:
             seconds_day = 0
-        month = str(today)[:7]  # year-month as string
+        month = today[:7]  # year-month as string
         seconds_month = 0
-        for today, seconds in self.usage["usage_history"]["transcription_seconds"].items():
-            if today.startswith(month):
-                seconds_month += seconds
+        for seconds in month_values(self.usage["usage_history"]["transcription_seconds"], month):
+            seconds_month += seconds
         minutes_day, seconds_day = divmod(seconds_day, 60)
         minutes_month, seconds_month = divmod(seconds_month, 60)
         return int(minutes_day), round(seconds_day, 2), int(minutes_month), round(seconds_month, 2)
@@ -329,26 +354,28 @@ class UsageTracker:
             else:
                 cost_month = 0.0
         # add to all_time cost, initialize with calculation of total_cost if key doesn't exist
-        cost_all_time = self.usage["current_cost"].get("all_time", self.initialize_all_time_cost())
+        if "all_time" in self.usage["current_cost"]:
+            cost_all_time = self.usage["current_cost"]["all_time"]
+        else:
+            cost_all_time = self.initialize_all_time_cost()
         return {"cost_today": cost_day, "cost_month": cost_month, "cost_all_time": cost_all_time}
 
-    def initialize_all_time_cost(self, tokens_price=0.002, image_prices="0.016,0.018,0.02", minute_price=0.006, vision_token_price=0.01, tts_prices='0.015,0.030'):
+    def initialize_all_time_cost(self, tokens_price=0.002, image_prices=(0.016, 0.018, 0.02), minute_price=0.006, vision_token_price=0.01, tts_prices=(0.015, 0.030)):
         """Get total USD amount of all requests in history
         
         :param tokens_price: price per 1000 tokens, defaults to 0.002
         :param image_prices: prices for images of sizes ["256x256", "512x512", "1024x1024"],
-            defaults to [0.016, 0.018, 0.02]
+            defaults to (0.016, 0.018, 0.02)
         :param minute_price: price per minute transcription, defaults to 0.006
         :param vision_token_price: price per 1K vision token interpretation, defaults to 0.01
-        :param tts_prices: price per 1K characters tts per model ['tts-1', 'tts-1-hd'], defaults to [0.015, 0.030]
+        :param tts_prices: price per 1K characters tts per model ['tts-1', 'tts-1-hd'], defaults to (0.015, 0.030)
         :return: total cost of all requests
         """
         total_tokens = sum(self.usage['usage_history']['chat_tokens'].values())
         token_cost = round(total_tokens * tokens_price / 1000, 6)
 
         total_images = [sum(values) for values in zip(*self.usage['usage_history']['number_images'].values())]
-        image_prices_list = [float(x) for x in image_prices.split(',')]
-        image_cost = sum([count * price for count, price in zip(total_images, image_prices_list)])
+        image_cost = sum(count * price for count, price in zip(total_images, image_prices))
 
         total_transcription_seconds = sum(self.usage['usage_history']['transcription_seconds'].values())
         transcription_cost = round(total_transcription_seconds * minute_price / 60, 2)
@@ -356,9 +383,9 @@ class UsageTracker:
         total_vision_tokens = sum(self.usage['usage_history']['vision_tokens'].values())
         vision_cost = round(total_vision_tokens * vision_token_price / 1000, 2)
 
-        total_characters = [sum(tts_model.values()) for tts_model in self.usage['usage_history']['tts_characters'].values()]
-        tts_prices_list = [float(x) for x in tts_prices.split(',')]
-        tts_cost = round(sum([count * price / 1000 for count, price in zip(total_characters, tts_prices_list)]), 2)
+        # look prices up by model name, tts_characters is keyed in the order models were first used
+        tts_cost = round(sum(sum(characters.values()) * tts_prices[TTS_MODEL_INDEX[tts_model]] / 1000
+                             for tts_model, characters in self.usage['usage_history']['tts_characters'].items()), 2)
 
         all_time_cost = token_cost + transcription_cost + image_cost + vision_cost + tts_cost
         return all_time_cost
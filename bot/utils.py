@@ -6,6 +6,7 @@ import json
 import logging
 import os
 import base64
+from functools import lru_cache
 
 import telegram
 from telegram import Message, MessageEntity, Update, ChatMember, constants, InlineKeyboardButton, InlineKeyboardMarkup
@@ -149,6 +150,14 @@ async def error_handler(_: object, context: ContextTypes.DEFAULT_TYPE) -> None:
     logging.error(f'Exception while handling an update: {context.error}')
 
 
+@lru_cache(maxsize=None)
+def user_id_set(user_ids: str) -> frozenset[str]:
+    """
+    Parses a comma separated list of user ids into a set, memoized per raw config value.
+    """
+    return frozenset(user_ids.split(','))
+
+
 async def is_allowed(config, update: Update, context: CallbackContext, is_inline=False) -> bool:
     """
     Checks if the user is allowed to use the bot.
@@ -160,12 +169,12 @@ async def is_allowed(config, update: Update, context: CallbackContext, is_inline
     if is_admin(config, user_id):
         return True
     name = update.inline_query.from_user.name if is_inline else update.message.from_user.name
-    allowed_user_ids = config['allowed_user_ids'].split(',')
     # Check if user is allowed
-    if str(user_id) in allowed_user_ids:
+    if str(user_id) in user_id_set(config['allowed_user_ids']):
         return True
     # Check if it's a group a chat with at least one authorized member
     if not is_inline and is_group_chat(update):
+        allowed_user_ids = config['allowed_user_ids'].split(',')
         admin_user_ids = config['admin_user_ids'].split(',')
         for user in itertools.chain(allowed_user_ids, admin_user_ids):
             if not user.strip():
@@ -188,10 +197,8 @@ def is_admin(config, user_id: int, log_no_admin=False) -> bool:
             logging.info('No admin user defined.')
         return False
 
-    admin_user_ids = config['admin_user_ids'].split(',')
-
     # Check if user is in the admin user list
-    if str(user_id) in admin_user_ids:
+    if str(user_id) in user_id_set(config['admin_user_ids']):
         return True
 
     return False
@@ -295,8 +302,7 @@ def add_chat_request_to_usage_tracker(usage, config, user_id, used_tokens):
         # add chat request to users usage tracker
         usage[user_id].add_chat_tokens(used_tokens, config['token_price'])
         # add guest chat request to guest usage tracker
-        allowed_user_ids = config['allowed_user_ids'].split(',')
-        if str(user_id) not in allowed_user_ids and 'guests' in usage:
+        if str(user_id) not in user_id_set(config['allowed_user_ids']) and 'guests' in usage:
             usage["guests"].add_chat_tokens(used_tokens, config['token_price'])
     except Exception as e:
         logging.warning(f'Failed to add tokens to usage_logs: {str(e)}')
@@ -452,8 +458,8 @@ def get_paginated_keyboard(page_index):
                 )
 
         reply_markup = InlineKeyboardMarkup(keyboard)
-        logging.info(f"replay markup from utils {reply_markup}")
-        logging.info(f"text from utils {text}")
+        logging.debug('reply markup: %s', reply_markup)
+        logging.debug('text: %s', text)
         return text, reply_markup
     else:
         raise ValueError("chat modes list is empty or None")